@@ -965,7 +965,7 @@ class Window:
         if not widget_name:
             # if widget_name wasn't provided, `get_widget` will have
             # ensured that there is a single widget available.
-            widget_name = list(plugin_manager._dock_widgets[plugin_name])[0]
+            widget_name = next(iter(plugin_manager._dock_widgets[plugin_name]))
 
         full_name = plugin_menu_item_template.format(plugin_name, widget_name)
         if full_name in self._dock_widgets:
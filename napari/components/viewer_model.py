@@ -744,6 +744,7 @@ class ViewerModel(KeymapProvider, MousemapProvider, EventedModel):
         """
         from ..plugins import plugin_manager
 
+        plugin_manager.discover_sample_data()
         try:
             data = plugin_manager._sample_data[plugin][sample]['data']
         except KeyError:
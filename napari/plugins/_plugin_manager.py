@@ -2,7 +2,6 @@ import importlib
 import sys
 from functools import partial
 from pathlib import Path
-from types import FunctionType
 from typing import (
     Any,
     Callable,
@@ -39,6 +38,16 @@ class PluginHookOption(TypedDict):
 
 CallOrderDict = Dict[str, List[PluginHookOption]]
 
+# hook names used in warning messages
+_HOOK_DOCK = '`napari_experimental_provide_dock_widget`'
+_HOOK_FUNC = '`napari_experimental_provide_function`'
+_HOOK_SAMPLE = 'napari_provide_sample_data'
+
+
+def _as_iter(obj: Any) -> Union[list, tuple]:
+    """Return `obj` if it is a list, otherwise wrap it in a 1-tuple."""
+    return obj if isinstance(obj, list) else (obj,)
+
 
 class NapariPluginManager(PluginManager):
     """PluginManager subclass for napari-specific functionality.
@@ -74,12 +83,16 @@ class NapariPluginManager(PluginManager):
             self.add_hookspecs(hook_specifications)
 
         self._sample_data: Dict[str, Dict[str, SampleDict]] = dict()
+        self._sample_data_discovered = False
+        # flattened (plugin_name, sample_name) keys of `_sample_data`
+        self._available_samples: Optional[Tuple[Tuple[str, str], ...]] = None
         self._dock_widgets: Dict[
             str, Dict[str, Tuple[WidgetCallable, Dict[str, Any]]]
         ] = dict()
         self._function_widgets: Dict[
             str, Dict[str, Callable[..., Any]]
         ] = dict()
+        self._widgets_discovered = False
 
         if sys.platform.startswith('linux') and running_as_bundled_app():
             sys.path.append(user_site_packages())
@@ -115,6 +128,7 @@ class NapariPluginManager(PluginManager):
         plugin = super().unregister(name_or_object)
 
         # remove widgets, sample data
+        self._available_samples = None
         for _dict in (
             self._dock_widgets,
             self._sample_data,
@@ -218,25 +232,24 @@ class NapariPluginManager(PluginManager):
             The hook implementation that returned the dict
         """
         plugin_name = hookimpl.plugin_name
-        hook_name = 'napari_provide_sample_data'
         if not isinstance(data, dict):
             warn_message = trans._(
                 'Plugin {plugin_name!r} provided a non-dict object to {hook_name!r}: data ignored.',
                 deferred=True,
                 plugin_name=plugin_name,
-                hook_name=hook_name,
+                hook_name=_HOOK_SAMPLE,
             )
             warn(message=warn_message)
             return
 
-        _data = {}
-        for name, datum in list(data.items()):
+        plugin_samples = self._sample_data.setdefault(plugin_name, {})
+        for name, datum in data.items():
             if isinstance(datum, dict):
                 if 'data' not in datum or 'display_name' not in datum:
                     warn_message = trans._(
                         'In {hook_name!r}, plugin {plugin_name!r} provided an invalid dict object for key {name!r} that does not have required keys: "data" and "display_name". Ignoring',
                         deferred=True,
-                        hook_name=hook_name,
+                        hook_name=_HOOK_SAMPLE,
                         plugin_name=plugin_name,
                         name=name,
                     )
@@ -254,17 +267,14 @@ class NapariPluginManager(PluginManager):
                     deferred=True,
                     plugin_name=plugin_name,
                     name=name,
-                    hook_name=hook_name,
+                    hook_name=_HOOK_SAMPLE,
                     dtype=type(datum["data"]),
                 )
                 warn(message=warn_message)
                 continue
-            _data[name] = datum
-
-        if plugin_name not in self._sample_data:
-            self._sample_data[plugin_name] = {}
+            plugin_samples[name] = datum
 
-        self._sample_data[plugin_name].update(_data)
+        self._available_samples = None
 
     def available_samples(self) -> Tuple[Tuple[str, str], ...]:
         """Return a tuple of sample data keys provided by plugins.
@@ -288,9 +298,12 @@ class NapariPluginManager(PluginManager):
                 # load first available sample
                 viewer.open_sample(*sample_keys[0])
         """
-        return tuple(
-            (p, s) for p in self._sample_data for s in self._sample_data[p]
-        )
+        self.discover_sample_data()
+        if self._available_samples is None:
+            self._available_samples = tuple(
+                (p, s) for p in self._sample_data for s in self._sample_data[p]
+            )
+        return self._available_samples
 
     # FUNCTION & DOCK WIDGETS -----------------------
 
@@ -308,15 +321,14 @@ class NapariPluginManager(PluginManager):
     ):
 
         plugin_name = hookimpl.plugin_name
-        hook_name = '`napari_experimental_provide_dock_widget`'
-        for arg in args if isinstance(args, list) else [args]:
+        for arg in _as_iter(args):
             if isinstance(arg, tuple):
                 if not arg:
                     warn_message = trans._(
                         'Plugin {plugin_name!r} provided an invalid tuple to {hook_name}.  Skipping',
                         deferred=True,
                         plugin_name=plugin_name,
-                        hook_name=hook_name,
+                        hook_name=_HOOK_DOCK,
                     )
                     warn(message=warn_message)
                     continue
@@ -330,7 +342,7 @@ class NapariPluginManager(PluginManager):
                     'Plugin {plugin_name!r} provided a non-callable object (widget) to {hook_name}: {_cls!r}. Widget ignored.',
                     deferred=True,
                     plugin_name=plugin_name,
-                    hook_name=hook_name,
+                    hook_name=_HOOK_DOCK,
                     _cls=_cls,
                 )
                 warn(message=warn_message)
@@ -342,7 +354,7 @@ class NapariPluginManager(PluginManager):
                     'Plugin {plugin_name!r} provided invalid kwargs to {hook_name} for class {clsname}. Widget ignored.',
                     deferred=True,
                     plugin_name=plugin_name,
-                    hook_name=hook_name,
+                    hook_name=_HOOK_DOCK,
                     clsname=_cls.__name__,
                 )
                 warn(message=warn_message)
@@ -353,10 +365,8 @@ class NapariPluginManager(PluginManager):
                 _cls.__name__
             )
 
-            if plugin_name not in self._dock_widgets:
-                # tried defaultdict(dict) but got odd KeyErrors...
-                self._dock_widgets[plugin_name] = {}
-            elif name in self._dock_widgets[plugin_name]:
+            plugin_widgets = self._dock_widgets.setdefault(plugin_name, {})
+            if name in plugin_widgets:
                 warn_message = trans._(
                     'Plugin {plugin_name!r} has already registered a dock widget {name!r} which has now been overwritten',
                     deferred=True,
@@ -365,7 +375,7 @@ class NapariPluginManager(PluginManager):
                 )
                 warn(message=warn_message)
 
-            self._dock_widgets[plugin_name][name] = (_cls, kwargs)
+            plugin_widgets[name] = (_cls, kwargs)
 
     def register_function_widget(
         self,
@@ -373,15 +383,16 @@ class NapariPluginManager(PluginManager):
         hookimpl: HookImplementation,
     ):
         plugin_name = hookimpl.plugin_name
-        hook_name = '`napari_experimental_provide_function`'
-        for func in args if isinstance(args, list) else [args]:
-            if not isinstance(func, FunctionType):
+        for func in _as_iter(args):
+            # accept any callable (e.g. functools.partial or compiled
+            # functions), but not classes: those belong in dock widgets
+            if not callable(func) or isinstance(func, type):
                 warn_message = trans._(
-                    'Plugin {plugin_name!r} provided a non-callable type to {hook_name}: {functype!r}. Function widget ignored.',
+                    'Plugin {plugin_name!r} provided an object to {hook_name} that is not a callable or is a class: {func!r}. Function widget ignored.',
                     deferred=True,
-                    functype=type(func),
+                    func=func,
                     plugin_name=plugin_name,
-                    hook_name=hook_name,
+                    hook_name=_HOOK_FUNC,
                 )
 
                 if isinstance(func, tuple):
@@ -392,13 +403,13 @@ class NapariPluginManager(PluginManager):
                 warn(message=warn_message)
                 continue
 
-            # Get function name
-            name = func.__name__.replace('_', ' ')
+            # Get function name (partial objects have no __name__)
+            _func = func.func if isinstance(func, partial) else func
+            name = getattr(_func, '__name__', type(_func).__name__)
+            name = name.replace('_', ' ')
 
-            if plugin_name not in self._function_widgets:
-                # tried defaultdict(dict) but got odd KeyErrors...
-                self._function_widgets[plugin_name] = {}
-            elif name in self._function_widgets[plugin_name]:
+            plugin_widgets = self._function_widgets.setdefault(plugin_name, {})
+            if name in plugin_widgets:
                 warn_message = trans._(
                     'Plugin {plugin_name!r} has already registered a function widget {name!r} which has now been overwritten',
                     deferred=True,
@@ -407,11 +418,18 @@ class NapariPluginManager(PluginManager):
                 )
                 warn(message=warn_message)
 
-            self._function_widgets[plugin_name][name] = func
+            plugin_widgets[name] = func
 
     def discover_sample_data(self):
-        if self._sample_data:
+        """Trigger discovery of sample data provided by plugins.
+
+        This imports every plugin implementing ``napari_provide_sample_data``,
+        so it is deferred until sample data is first needed.  As a "historic"
+        hook, it only needs to be called once.
+        """
+        if self._sample_data_discovered:
             return
+        self._sample_data_discovered = True
         self.hook.napari_provide_sample_data.call_historic(
             result_callback=partial(self.register_sample_data), with_impl=True
         )
@@ -424,8 +442,9 @@ class NapariPluginManager(PluginManager):
         is called will be added.)
         """
 
-        if self._dock_widgets:
+        if self._widgets_discovered:
             return
+        self._widgets_discovered = True
         self.hook.napari_experimental_provide_dock_widget.call_historic(
             partial(self.register_dock_widget), with_impl=True
         )
@@ -485,7 +504,7 @@ class NapariPluginManager(PluginManager):
                 )
                 raise ValueError(msg)
 
-            widget_name = list(plg_wdgs)[0]
+            widget_name = next(iter(plg_wdgs))
         else:
             if widget_name not in plg_wdgs:
                 msg = trans._(
@@ -1,3 +1,5 @@
+from functools import partial
+
 import pytest
 from napari_plugin_engine import napari_hook_implementation
 
@@ -17,6 +19,7 @@ fwidget_args = {
     'bad_full_func_tuple': (func, {'auto_call': True}, {'area': 'right'}),
     'bad_tuple_list': [(func, {'auto_call': True}), (func2, {})],
     'bad_func': 1,
+    'bad_class': int,
     'bad_tuple1': (func, 1),
     'bad_tuple2': (func, {}, 1),
     'bad_tuple3': (func, 1, {}),
@@ -52,3 +55,45 @@ def test_function_widget_registration(
         assert len(recwarn) == 0
         if 'list_func' in request.node.name:
             assert f_widgets['Plugin']['func2'] == func2
+
+
+def test_widget_hooks_called_once(napari_plugin_manager):
+    """Test that repeated widget discovery does not re-call plugin hooks."""
+    calls = []
+
+    class Plugin:
+        @napari_hook_implementation
+        def napari_experimental_provide_function():
+            calls.append(1)
+            return func
+
+    napari_plugin_manager.discover_widgets()
+    napari_plugin_manager.discover_widgets()
+    napari_plugin_manager.register(Plugin, name='Plugin')
+    napari_plugin_manager.discover_widgets()
+    assert len(calls) == 1
+
+
+def test_function_widget_callables(napari_plugin_manager, recwarn):
+    """Test that non-function callables are accepted as function widgets."""
+    pfunc = partial(func, y=1)
+
+    class Scaler:
+        def __call__(self, x: int, factor: float = 2.0) -> float:
+            return x * factor
+
+    scaler = Scaler()
+
+    class Plugin:
+        @napari_hook_implementation
+        def napari_experimental_provide_function():
+            return [pfunc, scaler]
+
+    napari_plugin_manager.discover_widgets()
+    napari_plugin_manager.register(Plugin, name='Plugin')
+
+    f_widgets = napari_plugin_manager._function_widgets
+    assert f_widgets['Plugin']['func'] is pfunc
+    # instances without __name__ are named after their type
+    assert f_widgets['Plugin']['Scaler'] is scaler
+    assert len(recwarn) == 0
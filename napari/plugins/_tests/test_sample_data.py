@@ -76,3 +76,47 @@ def test_sample_hook(napari_plugin_manager):
     assert viewer.layers[-1].source == Source(
         sample=('test_plugin', 'samp_key')
     )
+
+
+def test_sample_data_discovered_lazily(napari_plugin_manager):
+    """Sample data hooks are only called once, on first use."""
+    calls = []
+
+    class test_plugin:
+        @napari_hook_implementation
+        def napari_provide_sample_data():
+            calls.append(1)
+            return {'random data': lambda: []}
+
+    napari_plugin_manager.register(test_plugin)
+    assert not calls
+
+    assert ('test_plugin', 'random data') in (
+        napari_plugin_manager.available_samples()
+    )
+    assert len(calls) == 1
+
+    napari_plugin_manager.available_samples()
+    napari_plugin_manager.discover_sample_data()
+    assert len(calls) == 1
+
+
+def test_available_samples_cache(napari_plugin_manager):
+    """available_samples is cached and updated on (un)registration."""
+
+    class test_plugin:
+        @napari_hook_implementation
+        def napari_provide_sample_data():
+            return {'random data': lambda: []}
+
+    samples = napari_plugin_manager.available_samples()
+    assert napari_plugin_manager.available_samples() is samples
+    assert ('test_plugin', 'random data') not in samples
+
+    napari_plugin_manager.register(test_plugin)
+    samples = napari_plugin_manager.available_samples()
+    assert ('test_plugin', 'random data') in samples
+
+    napari_plugin_manager.unregister(test_plugin)
+    samples = napari_plugin_manager.available_samples()
+    assert ('test_plugin', 'random data') not in samples
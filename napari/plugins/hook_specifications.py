@@ -402,8 +402,11 @@ def napari_experimental_provide_function() -> Union[
     -------
     function(s) : FunctionType or list of FunctionType
         Implementations should provide either a single function, or a list of
-        functions. Note that this does not preclude specifying multiple
-        separate implementations in the same module or class.
+        functions. Other callables, such as ``functools.partial`` objects or
+        compiled (e.g. Cython) functions, are also accepted, but classes are
+        not (use ``napari_experimental_provide_dock_widget`` for those).
+        Note that this does not preclude specifying multiple separate
+        implementations in the same module or class.
         The functions should have Python type annotations so that
         `magicgui <https://napari.org/magicgui>`_ can generate a widget from
         them.
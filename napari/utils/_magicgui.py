@@ -19,14 +19,6 @@ from ..utils.misc import ensure_list_of_layer_data_tuple
 from ..utils.translations import trans
 from ..viewer import Viewer
 
-try:
-    from magicgui import register_type
-except ImportError:
-
-    def register_type(*args, **kwargs):
-        pass
-
-
 if TYPE_CHECKING:
     from magicgui.widgets._bases import CategoricalWidget
 
@@ -60,6 +52,7 @@ def register_types_with_magicgui():
         return
     register_types_with_magicgui._called = True
 
+    from magicgui import register_type
     from magicgui.widgets import FunctionGui
 
     # the widget field in `_source.py` was defined with a forward reference
@@ -8,6 +8,7 @@ import os
 import re
 import sys
 from enum import Enum, EnumMeta
+from functools import lru_cache
 from os import PathLike, fspath, path
 from pathlib import Path
 from typing import (
@@ -279,6 +280,7 @@ def camel_to_snake(name):
     return camel_to_snake_pattern.sub(r'\1_\2', name).lower()
 
 
+@lru_cache(maxsize=None)
 def camel_to_spaces(val):
     return camel_to_spaces_pattern.sub(r" \1", val)
 
@@ -1453,6 +1453,7 @@ SKIP_WORDS = {
         'vertex-index',
     ],
     'napari/plugins/_plugin_manager.py': [
+        '__name__',
         '`napari_experimental_provide_dock_widget`',
         '`napari_experimental_provide_function`',
         'builtins',